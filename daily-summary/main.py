@@ -1,11 +1,17 @@
+import atexit
 import os
+import re
 import sys
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import anthropic
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,12 +19,36 @@ logging.basicConfig(
 )
 log = logging.getLogger("daily-summary")
 
+# Shared session so the fetch and send calls reuse one pooled connection to
+# the bridge instead of handshaking per request.
+_session = requests.Session()
+# 48h message payloads compress well; ask the bridge for gzip explicitly.
+_session.headers["Accept-Encoding"] = "gzip"
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+atexit.register(_session.close)
+
 BRIDGE_URL = os.environ.get("BRIDGE_INTERNAL_URL", "http://localhost:8080")
 BRIDGE_API_KEY = os.environ.get("BRIDGE_API_KEY", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 RECIPIENT_PHONE = os.environ.get("RECIPIENT_PHONE", "27722066795")
 MESSAGE_HOURS = int(os.environ.get("MESSAGE_HOURS", "48"))
 DRY_RUN = os.environ.get("DRY_RUN", "false").lower() in ("true", "1", "yes")
+# Batch API halves per-token cost but adds polling latency; keep the sync
+# endpoint as the default for the single daily digest.
+USE_BATCH_API = os.environ.get("USE_BATCH_API", "false").lower() in ("true", "1", "yes")
+BATCH_POLL_SECONDS = 20
+# WhatsApp caps messages around 4096 chars; leave headroom for safety.
+MAX_MESSAGE_LEN = 3500
+# Prompt budget: prune noise before Claude sees it, since input tokens are
+# what we pay for. ~80k chars is roughly 20k tokens.
+MAX_DIGEST_CHARS = int(os.environ.get("MAX_DIGEST_CHARS", "80000"))
+MAX_MESSAGES_PER_CHAT = 30
+
+_EMOJI_ONLY_RE = re.compile("^[\\U0001F000-\\U0001FFFF\u2600-\u27BF\uFE0F\u200D\\s]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SKIP_PLACEHOLDERS = ("[sticker]", "[gif]")
 
 SYSTEM_PROMPT = """You are Jarred's personal WhatsApp assistant. Your job is to analyze his recent WhatsApp conversations and produce a concise daily action-item summary.
 
@@ -70,10 +100,12 @@ def fetch_recent_messages():
         headers["X-API-Key"] = BRIDGE_API_KEY
 
     log.info("Fetching messages from %s (last %d hours)...", url, MESSAGE_HOURS)
-    resp = requests.get(url, params=params, headers=headers, timeout=30)
+    resp = _session.get(url, params=params, headers=headers, timeout=30)
     resp.raise_for_status()
 
-    messages = resp.json()
+    # orjson parses the large message payload several times faster than
+    # the stdlib decoder behind resp.json()
+    messages = orjson.loads(resp.content)
     if messages is None:
         messages = []
 
@@ -83,12 +115,9 @@ def fetch_recent_messages():
 
 def format_messages_digest(messages):
     """Group messages by chat and format as a readable digest for Claude."""
+    # Store (sender, content, ts) tuples rather than a dict per message.
     chats = {}
     for msg in messages:
-        chat_name = msg.get("chat_name", msg.get("chat_jid", "Unknown"))
-        if chat_name not in chats:
-            chats[chat_name] = []
-
         sender = "Jarred" if msg.get("is_from_me") else msg.get("sender", "Unknown")
         content = msg.get("content", "")
         transcription = msg.get("transcription", "")
@@ -99,29 +128,137 @@ def format_messages_digest(messages):
         display_content = transcription if transcription else content
         if not display_content and media_type:
             display_content = f"[{media_type}]"
+        if not display_content:
+            continue
+
+        # Drop content that costs tokens but carries no action items:
+        # stickers/gifs, one-or-two-char reactions, emoji-only replies.
+        display_content = _WHITESPACE_RE.sub(" ", display_content).strip()
+        if len(display_content) < 3:
+            continue
+        if display_content.lower().startswith(_SKIP_PLACEHOLDERS):
+            continue
+        if _EMOJI_ONLY_RE.match(display_content):
+            continue
 
-        if display_content:
-            chats[chat_name].append({
-                "sender": sender,
-                "content": display_content,
-                "timestamp": timestamp,
-            })
+        chat_name = msg.get("chat_name", msg.get("chat_jid", "Unknown"))
+        chats.setdefault(chat_name, []).append(
+            (sender, display_content, timestamp[:16] if timestamp else "")
+        )
 
-    # Format as text digest
+    # Format as text digest, busiest chats first
+    chat_sizes = {name: len(msgs) for name, msgs in chats.items()}
     lines = []
-    for chat_name, msgs in sorted(chats.items(), key=lambda x: len(x[1]), reverse=True):
-        if not msgs:
-            continue
+    for chat_name in sorted(chat_sizes, key=chat_sizes.__getitem__, reverse=True):
+        # Keep only the most recent messages per chat; busy groups would
+        # otherwise dominate the token budget.
+        msgs = chats[chat_name][-MAX_MESSAGES_PER_CHAT:]
         lines.append(f"\n=== {chat_name} ({len(msgs)} messages) ===")
-        for m in msgs:
-            ts = m["timestamp"][:16] if m["timestamp"] else ""
-            lines.append(f"[{ts}] {m['sender']}: {m['content']}")
+        lines.extend(f"[{ts}] {sender}: {content}" for sender, content, ts in msgs)
+
+    digest = "\n".join(lines)
+    if len(digest) > MAX_DIGEST_CHARS:
+        cut = digest.rfind("\n", 0, MAX_DIGEST_CHARS)
+        digest = digest[: cut if cut > 0 else MAX_DIGEST_CHARS]
+        log.warning("Digest truncated to ~%d chars to bound prompt size", MAX_DIGEST_CHARS)
+    return digest
+
+
+def _build_request_params(digest):
+    """Build the Messages API params shared by the sync and batch paths."""
+    return {
+        "model": "claude-sonnet-4-5-20250929",
+        "max_tokens": 1024,
+        # The system prompt never changes, so mark it cacheable: repeat calls
+        # within the cache window only pay 10% of its input tokens.
+        "system": [
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [
+            {
+                "role": "user",
+                "content": f"Here are Jarred's WhatsApp messages from the last {MESSAGE_HOURS} hours. Please analyze them and produce his daily action-item summary:\n\n{digest}",
+            }
+        ],
+    }
 
-    return "\n".join(lines)
 
+def analyze_batch_with_claude(client, digests):
+    """Run one or more digest analyses through the Messages Batches API.
 
-def analyze_with_claude(digest):
-    """Send the message digest to Claude for analysis."""
+    Batched requests are billed at half price, so this is the cheaper path
+    when there are multiple digests (or latency doesn't matter).
+    """
+    batch = client.messages.batches.create(
+        requests=[
+            {"custom_id": f"digest-{i}", "params": _build_request_params(d)}
+            for i, d in enumerate(digests)
+        ]
+    )
+    log.info("Submitted batch %s (%d requests), polling...", batch.id, len(digests))
+
+    while batch.processing_status != "ended":
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    summaries = {}
+    for result in client.messages.batches.results(batch.id):
+        if result.result.type == "succeeded":
+            summaries[result.custom_id] = result.result.message.content[0].text
+        else:
+            log.error("Batch request %s failed: %s", result.custom_id, result.result.type)
+
+    return [summaries[f"digest-{i}"] for i in range(len(digests)) if f"digest-{i}" in summaries]
+
+
+def _stream_summary(client, params, sink=None):
+    """Stream the completion, optionally flushing finished parts to sink.
+
+    With a sink, whole-line parts upload to the bridge while Claude is still
+    generating, so LLM latency and HTTP latency overlap instead of stacking.
+    A single worker keeps the parts arriving in order.
+    """
+    full = []
+    buf = ""
+    futures = []
+    executor = ThreadPoolExecutor(max_workers=1) if sink is not None else None
+
+    with client.messages.stream(**params) as stream:
+        for text in stream.text_stream:
+            full.append(text)
+            if executor is None:
+                continue
+            buf += text
+            while len(buf) > MAX_MESSAGE_LEN:
+                cut = buf.rfind("\n", 0, MAX_MESSAGE_LEN)
+                if cut <= 0:
+                    cut = MAX_MESSAGE_LEN
+                part = buf[:cut].strip()
+                if part:
+                    futures.append(executor.submit(sink, part))
+                buf = buf[cut:].lstrip("\n")
+
+    if executor is not None:
+        tail = buf.strip()
+        if tail:
+            futures.append(executor.submit(sink, tail))
+        for future in futures:
+            future.result()
+        executor.shutdown()
+
+    return "".join(full)
+
+
+def analyze_with_claude(digest, sink=None):
+    """Send the message digest to Claude for analysis.
+
+    If sink is given, the summary is also delivered through it (streamed
+    incrementally on the sync path).
+    """
     if not ANTHROPIC_API_KEY:
         log.error("ANTHROPIC_API_KEY not set")
         sys.exit(1)
@@ -130,19 +267,17 @@ def analyze_with_claude(digest):
 
     log.info("Sending %d chars of digest to Claude for analysis...", len(digest))
 
-    message = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=1024,
-        system=SYSTEM_PROMPT,
-        messages=[
-            {
-                "role": "user",
-                "content": f"Here are Jarred's WhatsApp messages from the last {MESSAGE_HOURS} hours. Please analyze them and produce his daily action-item summary:\n\n{digest}",
-            }
-        ],
-    )
+    if USE_BATCH_API:
+        summaries = analyze_batch_with_claude(client, [digest])
+        if not summaries:
+            log.error("Batch analysis returned no results")
+            sys.exit(1)
+        summary = summaries[0]
+        if sink is not None:
+            sink(summary)
+    else:
+        summary = _stream_summary(client, _build_request_params(digest), sink)
 
-    summary = message.content[0].text
     log.info("Claude generated summary (%d chars)", len(summary))
     return summary
 
@@ -160,7 +295,7 @@ def send_whatsapp_message(summary):
     }
 
     log.info("Sending summary to %s...", RECIPIENT_PHONE)
-    resp = requests.post(url, json=payload, headers=headers, timeout=30)
+    resp = _session.post(url, json=payload, headers=headers, timeout=30)
     resp.raise_for_status()
 
     result = resp.json()
@@ -191,17 +326,16 @@ def main():
         log.info("No meaningful content to summarize.")
         return
 
-    # Step 3: Analyze with Claude
-    summary = analyze_with_claude(digest)
-
-    # Step 4: Send or print
+    # Step 3+4: Analyze with Claude, sending as the response streams in
+    # (or just printing it for dry runs)
     if DRY_RUN:
+        summary = analyze_with_claude(digest)
         log.info("DRY RUN - Summary would be sent to %s:", RECIPIENT_PHONE)
         print("\n" + "=" * 50)
         print(summary)
         print("=" * 50 + "\n")
     else:
-        send_whatsapp_message(summary)
+        analyze_with_claude(digest, sink=send_whatsapp_message)
 
     log.info("Done!")
 
@@ -1,9 +1,10 @@
-import json
 import logging
 import os
+
+import orjson
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from ..models.events import Event
 
@@ -15,10 +16,11 @@ class Collector(ABC):
 
     def __init__(self, state_file: str):
         self._state_file = state_file
+        self._state: Optional[dict] = None  # lazy-loaded mirror of the state file
 
     @abstractmethod
-    def collect(self, since: datetime) -> list[Event]:
-        """Fetch new data since the given timestamp."""
+    def collect(self, since: datetime) -> AsyncIterator[Event]:
+        """Yield new events since the given timestamp."""
         ...
 
     def get_last_collected(self) -> Optional[datetime]:
@@ -32,11 +34,18 @@ class Collector(ABC):
         state = self._load_state()
         state[self.name] = ts.isoformat()
         os.makedirs(os.path.dirname(self._state_file), exist_ok=True)
-        with open(self._state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        # Write-to-temp + rename so a crash mid-write can't truncate the
+        # state file, and the mirror means no re-parse on the next sweep.
+        tmp = self._state_file + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, self._state_file)
 
     def _load_state(self) -> dict:
-        if os.path.exists(self._state_file):
-            with open(self._state_file) as f:
-                return json.load(f)
-        return {}
+        if self._state is None:
+            if os.path.exists(self._state_file):
+                with open(self._state_file, "rb") as f:
+                    self._state = orjson.loads(f.read())
+            else:
+                self._state = {}
+        return self._state
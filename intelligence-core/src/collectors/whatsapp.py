@@ -1,9 +1,12 @@
+import asyncio
 import logging
 import os
-import sqlite3
 from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
 
+import aiosqlite
 import httpx
+import orjson
 
 from .base import Collector
 from ..models.events import Event
@@ -11,22 +14,80 @@ from .. import config
 
 log = logging.getLogger("intelligence-core.collectors.whatsapp")
 
+# Shared client so the 30-min collection sweeps reuse keep-alive connections
+# to the bridge rather than reconnecting each time.
+_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+    # 48h message payloads compress well; ask the bridge for gzip explicitly.
+    headers={"Accept-Encoding": "gzip"},
+    timeout=30.0,
+)
+
+
+# Media types come from a small fixed set, so intern the "[image]"-style
+# placeholder strings instead of re-formatting one per media message.
+_media_placeholders: dict[str, str] = {}
+
+
+def _derive_content(transcription, content, media_type) -> str:
+    """Coalesce transcription/content/media placeholder into display text."""
+    text = transcription or content
+    if text:
+        return text
+    if not media_type:
+        return ""
+    placeholder = _media_placeholders.get(media_type)
+    if placeholder is None:
+        placeholder = _media_placeholders[media_type] = f"[{media_type}]"
+    return placeholder
+
 
 class WhatsAppCollector(Collector):
     name = "whatsapp"
 
+    _indexes_ensured = False
+
     def __init__(self, db_path: str, state_file: str):
         super().__init__(state_file)
         self.db_path = db_path
 
-    def collect(self, since: datetime) -> list[Event]:
-        # Try direct SQLite first (local dev / shared volume)
-        if os.path.exists(self.db_path):
-            return self._collect_sqlite(since)
-        # Fall back to REST API (Railway)
-        return self._collect_api(since)
-
-    def _collect_api(self, since: datetime) -> list[Event]:
+    async def collect(self, since: datetime) -> AsyncIterator[Event]:
+        have_db = os.path.exists(self.db_path)
+
+        if have_db and config.COLLECT_BOTH_PATHS:
+            # The shared DB can lag replication while the bridge already has
+            # the messages, so read both in parallel (disk overlaps network)
+            # and dedup on source_id, preferring the SQLite copy.
+            async def drain(gen):
+                return [event async for event in gen]
+
+            results = await asyncio.gather(
+                drain(self._collect_sqlite(since)),
+                drain(self._collect_api(since)),
+                return_exceptions=True,
+            )
+            merged: dict[str, Event] = {}
+            for result in results:
+                if isinstance(result, BaseException):
+                    log.error("Collection path failed: %s", result)
+                    continue
+                for event in result:
+                    merged.setdefault(event.source_id, event)
+            for event in merged.values():
+                yield event
+            return
+
+        # Try direct SQLite first (local dev / shared volume), falling back
+        # to the REST API (Railway)
+        source = self._collect_sqlite(since) if have_db else self._collect_api(since)
+        async for event in source:
+            yield event
+
+    async def _collect_api(self, since: datetime) -> AsyncIterator[Event]:
         """Fetch messages from the WhatsApp bridge REST API."""
         hours = max(1, int((datetime.now(timezone.utc) - since).total_seconds() / 3600))
         url = f"{config.BRIDGE_URL}/api/messages/recent"
@@ -35,106 +96,142 @@ class WhatsAppCollector(Collector):
             headers["X-API-Key"] = config.BRIDGE_API_KEY
 
         try:
-            resp = httpx.get(url, params={"hours": hours}, headers=headers, timeout=30)
+            resp = await _client.get(url, params={"hours": hours}, headers=headers)
             resp.raise_for_status()
-            messages = resp.json()
+            messages = orjson.loads(resp.content)
         except httpx.HTTPError as e:
             log.error("Failed to fetch from bridge API: %s", e)
-            return []
+            return
 
         if not messages:
-            return []
+            return
 
-        events = []
+        count = 0
+        fromiso = datetime.fromisoformat
+        fallback_ts = datetime.now(timezone.utc)
         for msg in messages:
-            content = msg.get("transcription") or msg.get("content") or ""
-            if not content and msg.get("media_type"):
-                content = f"[{msg['media_type']}]"
+            get = msg.get
+            transcription = get("transcription")
+            media_type = get("media_type")
+            content = _derive_content(transcription, get("content"), media_type)
             if not content:
                 continue
 
-            sender = "Jarred" if msg.get("is_from_me") else msg.get("sender", "Unknown")
-            chat_name = msg.get("chat_name", msg.get("chat_jid", "Unknown"))
-            ts = msg.get("timestamp", "")
-
+            sender = get("sender")
+            chat_jid = get("chat_jid")
             try:
-                timestamp = datetime.fromisoformat(ts)
+                timestamp = fromiso(get("timestamp", ""))
             except (ValueError, TypeError):
-                timestamp = datetime.now(timezone.utc)
+                timestamp = fallback_ts
 
-            events.append(Event(
+            count += 1
+            yield Event(
                 source="whatsapp",
-                source_id=f"{msg.get('chat_jid', '')}:{msg.get('id', '')}",
+                source_id=f"{chat_jid or ''}:{get('id', '')}",
                 event_type="message",
                 timestamp=timestamp,
-                sender_name=sender,
-                sender_id=msg.get("sender"),
-                channel_name=chat_name,
-                channel_id=msg.get("chat_jid"),
+                sender_name="Jarred" if get("is_from_me") else (sender or "Unknown"),
+                sender_id=sender,
+                channel_name=get("chat_name") or chat_jid or "Unknown",
+                channel_id=chat_jid,
                 content=content,
                 metadata={
-                    "is_from_me": bool(msg.get("is_from_me")),
-                    "media_type": msg.get("media_type"),
-                    "has_transcription": bool(msg.get("transcription")),
+                    "is_from_me": bool(get("is_from_me")),
+                    "media_type": media_type,
+                    "has_transcription": bool(transcription),
                 },
-            ))
+            )
+
+        log.info("Collected %d WhatsApp messages via API since %s", count, since.isoformat())
 
-        log.info("Collected %d WhatsApp messages via API since %s", len(events), since.isoformat())
-        return events
+    async def _ensure_indexes(self):
+        """Best-effort: index the bridge DB so each sweep is a range scan.
 
-    def _collect_sqlite(self, since: datetime) -> list[Event]:
-        """Read messages directly from shared SQLite database."""
+        The bridge owns messages.db; if the volume is read-only or the DB is
+        locked we just carry on with whatever plan SQLite picks.
+        """
         try:
-            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
-        except sqlite3.OperationalError:
+            conn = await aiosqlite.connect(self.db_path)
+            try:
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_msg_timestamp ON messages(timestamp)"
+                )
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_chats_jid ON chats(jid)"
+                )
+                await conn.commit()
+            finally:
+                await conn.close()
+        except aiosqlite.OperationalError as e:
+            log.debug("Could not ensure indexes on %s: %s", self.db_path, e)
+        WhatsAppCollector._indexes_ensured = True
+
+    async def _collect_sqlite(self, since: datetime) -> AsyncIterator[Event]:
+        """Read messages directly from shared SQLite database, yielding Events."""
+        if not WhatsAppCollector._indexes_ensured:
+            await self._ensure_indexes()
+
+        try:
+            conn = await aiosqlite.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        except aiosqlite.OperationalError:
             log.warning("WhatsApp messages.db not accessible at %s, trying API", self.db_path)
-            return self._collect_api(since)
+            async for event in self._collect_api(since):
+                yield event
+            return
 
+        until = datetime.now(timezone.utc)
+        count = 0
         try:
-            rows = conn.execute(
+            # Serve page reads from mmap and keep this connection read-only.
+            await conn.executescript(
+                "PRAGMA mmap_size=268435456;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA query_only=1;"
+            )
+            # Bounded range so SQLite can use the timestamp index end to end.
+            # Plain tuple rows + hoisted lookups: cheaper per row than
+            # sqlite3.Row name lookups on multi-thousand-message sweeps.
+            fromiso = datetime.fromisoformat
+            async with conn.execute(
                 """SELECT m.id, m.chat_jid, m.sender, m.content, m.timestamp,
                           m.is_from_me, m.media_type, m.transcription,
                           c.name as chat_name
                    FROM messages m
                    LEFT JOIN chats c ON m.chat_jid = c.jid
-                   WHERE m.timestamp > ?
+                   WHERE m.timestamp > ? AND m.timestamp <= ?
                    ORDER BY m.timestamp""",
-                (since.isoformat(),),
-            ).fetchall()
-        except sqlite3.OperationalError as e:
+                (since.isoformat(), until.isoformat()),
+            ) as cur:
+                async for (msg_id, chat_jid, sender, content, ts,
+                           is_from_me, media_type, transcription, chat_name) in cur:
+                    content = _derive_content(transcription, content, media_type)
+                    if not content:
+                        continue
+
+                    count += 1
+                    yield Event(
+                        source="whatsapp",
+                        source_id=f"{chat_jid}:{msg_id}",
+                        event_type="message",
+                        timestamp=fromiso(ts),
+                        sender_name="Jarred" if is_from_me else (sender or "Unknown"),
+                        sender_id=sender,
+                        channel_name=chat_name or chat_jid or "Unknown",
+                        channel_id=chat_jid,
+                        content=content,
+                        metadata={
+                            "is_from_me": bool(is_from_me),
+                            "media_type": media_type,
+                            "has_transcription": bool(transcription),
+                        },
+                    )
+        except aiosqlite.OperationalError as e:
             log.error("Failed to query messages: %s", e)
-            conn.close()
-            return self._collect_api(since)
-
-        events = []
-        for row in rows:
-            content = row["transcription"] or row["content"] or ""
-            if not content and row["media_type"]:
-                content = f"[{row['media_type']}]"
-            if not content:
-                continue
-
-            sender = "Jarred" if row["is_from_me"] else (row["sender"] or "Unknown")
-            chat_name = row["chat_name"] or row["chat_jid"] or "Unknown"
-
-            events.append(Event(
-                source="whatsapp",
-                source_id=f"{row['chat_jid']}:{row['id']}",
-                event_type="message",
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                sender_name=sender,
-                sender_id=row["sender"],
-                channel_name=chat_name,
-                channel_id=row["chat_jid"],
-                content=content,
-                metadata={
-                    "is_from_me": bool(row["is_from_me"]),
-                    "media_type": row["media_type"],
-                    "has_transcription": bool(row["transcription"]),
-                },
-            ))
+            await conn.close()
+            async for event in self._collect_api(since):
+                yield event
+            return
 
-        conn.close()
-        log.info("Collected %d WhatsApp messages via SQLite since %s", len(events), since.isoformat())
-        return events
+        await conn.close()
+        log.info("Collected %d WhatsApp messages via SQLite since %s", count, since.isoformat())
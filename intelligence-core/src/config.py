@@ -10,6 +10,9 @@ RECIPIENT_PHONE = os.environ.get("RECIPIENT_PHONE", "27722066795")
 SUMMARY_HOUR = int(os.environ.get("SUMMARY_HOUR", "4"))  # UTC hour for daily synthesis
 MESSAGE_HOURS = int(os.environ.get("MESSAGE_HOURS", "48"))
 DRY_RUN = os.environ.get("DRY_RUN", "false").lower() in ("true", "1", "yes")
+# Collect from the shared SQLite DB and the bridge API concurrently and merge
+# (covers replication lag); off by default for single-source deployments.
+COLLECT_BOTH_PATHS = os.environ.get("COLLECT_BOTH_PATHS", "false").lower() in ("true", "1", "yes")
 
 # Source tokens (Phase 2+)
 GMAIL_P45_CREDENTIALS = os.environ.get("GMAIL_P45_CREDENTIALS", "")
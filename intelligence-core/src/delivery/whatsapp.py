@@ -1,3 +1,4 @@
+import atexit
 import logging
 
 import httpx
@@ -6,6 +7,18 @@ from .. import config
 
 log = logging.getLogger("intelligence-core.delivery")
 
+# Shared client so keep-alive connections to the bridge survive between sends
+# instead of paying a TCP/TLS handshake per message.
+_client = httpx.Client(
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+    timeout=30.0,
+)
+atexit.register(_client.close)
+
 
 def send_whatsapp_message(message: str) -> bool:
     """Send a message via the WhatsApp bridge REST API."""
@@ -20,7 +33,7 @@ def send_whatsapp_message(message: str) -> bool:
     }
 
     try:
-        resp = httpx.post(url, json=payload, headers=headers, timeout=30)
+        resp = _client.post(url, json=payload, headers=headers)
         resp.raise_for_status()
         result = resp.json()
         if result.get("success"):
@@ -1,10 +1,11 @@
+import asyncio
 import logging
 import os
 import sys
 import time
 from datetime import datetime, timedelta, timezone
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from . import config
 from .models.events import EventStore
@@ -21,7 +22,7 @@ logging.basicConfig(
 log = logging.getLogger("intelligence-core")
 
 
-def collect_whatsapp(event_store: EventStore, collector: WhatsAppCollector):
+async def collect_whatsapp(event_store: EventStore, collector: WhatsAppCollector):
     """Run WhatsApp collection sweep."""
     since = collector.get_last_collected()
     if since is None:
@@ -29,13 +30,29 @@ def collect_whatsapp(event_store: EventStore, collector: WhatsAppCollector):
 
     start = time.time()
     try:
-        events = collector.collect(since)
-        # Classify each event
-        for event in events:
-            event.domain = classify_event(event)
-        stored = event_store.store_events(events)
+        # Consume the collector lazily: classify as events stream through and
+        # store in batches, so a big sweep never holds every row twice.
+        # Within one sweep the same chat + sender nearly always classifies
+        # the same way, so reuse the first result instead of re-scanning
+        # content for every message. The cache dies with the sweep.
+        stored = 0
+        batch = []
+        domain_cache: dict = {}
+        async for event in collector.collect(since):
+            key = (event.channel_id, event.sender_id)
+            domain = domain_cache.get(key)
+            if domain is None:
+                domain = domain_cache[key] = classify_event(event)
+            event.domain = domain
+            batch.append(event)
+            if len(batch) >= 500:
+                stored += event_store.store_events(batch)
+                batch = []
+        # Final batch and the success log row share one transaction
         duration = time.time() - start
-        event_store.log_collection("whatsapp", stored, "success", duration=duration)
+        stored += event_store.store_and_log(
+            batch, "whatsapp", "success", duration=duration, prior=stored,
+        )
         if stored:
             log.info("WhatsApp: stored %d new events (%.1fs)", stored, duration)
         collector.set_last_collected(datetime.now(timezone.utc))
@@ -81,16 +98,24 @@ def run_synthesis(event_store: EventStore, memory_bank: MemoryBank):
 
 def _split_message(text: str, max_len: int) -> list[str]:
     """Split a message at line boundaries."""
+    # Accumulate lines in a list with a running length and join once per
+    # part, instead of repeatedly re-copying a growing string.
     parts = []
-    current = ""
+    cur_lines: list[str] = []
+    cur_len = 0
     for line in text.split("\n"):
-        if len(current) + len(line) + 1 > max_len:
-            parts.append(current.strip())
-            current = line + "\n"
-        else:
-            current += line + "\n"
-    if current.strip():
-        parts.append(current.strip())
+        line_len = len(line) + 1
+        if cur_len + line_len > max_len and cur_lines:
+            part = "\n".join(cur_lines).strip()
+            if part:
+                parts.append(part)
+            cur_lines = []
+            cur_len = 0
+        cur_lines.append(line)
+        cur_len += line_len
+    tail = "\n".join(cur_lines).strip()
+    if tail:
+        parts.append(tail)
     return parts
 
 
@@ -118,12 +143,16 @@ def main():
     # If run with --once flag, just do one collection + synthesis and exit
     if "--once" in sys.argv:
         log.info("Running one-shot collection + synthesis")
-        collect_whatsapp(event_store, wa_collector)
+        asyncio.run(collect_whatsapp(event_store, wa_collector))
         run_synthesis(event_store, memory_bank)
         return
 
-    # Set up scheduler
-    scheduler = BlockingScheduler()
+    # Set up scheduler on an asyncio loop so collector I/O (SQLite reads,
+    # bridge HTTP) can overlap once more collectors are added. run_synthesis
+    # stays sync and runs in the scheduler's executor.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    scheduler = AsyncIOScheduler(event_loop=loop)
 
     # WhatsApp collection: every 30 minutes
     scheduler.add_job(
@@ -141,7 +170,7 @@ def main():
 
     # Run initial collection immediately
     log.info("Running initial collection...")
-    collect_whatsapp(event_store, wa_collector)
+    loop.run_until_complete(collect_whatsapp(event_store, wa_collector))
 
     log.info(
         "Scheduler started. Next synthesis at %02d:00 UTC. "
@@ -149,10 +178,13 @@ def main():
         config.SUMMARY_HOUR,
     )
 
+    scheduler.start()
     try:
-        scheduler.start()
+        loop.run_forever()
     except (KeyboardInterrupt, SystemExit):
         log.info("Shutting down...")
+        scheduler.shutdown(wait=False)
+        loop.close()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 log = logging.getLogger("intelligence-core.memory")
@@ -8,21 +10,96 @@ log = logging.getLogger("intelligence-core.memory")
 class MemoryBank:
     def __init__(self, memory_dir: str):
         self.memory_dir = Path(memory_dir)
+        # Content cache keyed by mtime: unchanged files cost one stat()
+        # instead of a full read on every synthesis.
+        self._cache: dict[Path, tuple[int, str]] = {}
+        # One walked-once listing of .md paths per top-level category,
+        # shared by load_domain/load_all_memory/list_files.
+        self._scan_cache: dict[str, list[Path]] | None = None
+        # Small-file reads are latency-bound and release the GIL, so bulk
+        # loads fan out over a shared pool instead of reading serially.
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="memory-read")
+        # Active only inside session(): repeat reads skip even the stat().
+        self._session_cache: dict[Path, str] | None = None
+
+    @contextmanager
+    def session(self):
+        """Memoize reads for the scope of one synthesis run.
+
+        Within the scope, a file read once is served from memory without
+        re-statting; save_file keeps the cache coherent. The cache is
+        dropped on exit so long-running schedulers see fresh files next run.
+        """
+        # Re-walk per synthesis so files added or removed outside this
+        # process (the tree is editable by hand) are picked up.
+        self._scan_cache = None
+        self._session_cache = {}
+        try:
+            yield self
+        finally:
+            self._session_cache = None
 
     def ensure_structure(self):
         for subdir in ["people", "projects", "organizations", "system"]:
             (self.memory_dir / subdir).mkdir(parents=True, exist_ok=True)
 
+    def _scan(self) -> dict[str, list[Path]]:
+        """Walk the memory tree once, caching .md paths by top-level category."""
+        if self._scan_cache is None:
+            cache: dict[str, list[Path]] = {}
+            for root, _dirs, files in os.walk(self.memory_dir):
+                root_path = Path(root)
+                for name in files:
+                    if not name.endswith(".md") or name.startswith("_"):
+                        continue
+                    path = root_path / name
+                    rel_parts = path.relative_to(self.memory_dir).parts
+                    category = rel_parts[0] if len(rel_parts) > 1 else ""
+                    cache.setdefault(category, []).append(path)
+            for paths in cache.values():
+                paths.sort()
+            self._scan_cache = cache
+        return self._scan_cache
+
+    def _cached_read(self, path: Path) -> str | None:
+        if self._session_cache is not None:
+            cached = self._session_cache.get(path)
+            if cached is not None:
+                return cached
+        try:
+            mtime = path.stat().st_mtime_ns
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                content = cached[1]
+            else:
+                content = path.read_text(encoding="utf-8")
+                self._cache[path] = (mtime, content)
+        except FileNotFoundError:
+            # Deleted externally since the last walk: evict it so one stale
+            # scan entry can't keep failing every later bulk load.
+            self._cache.pop(path, None)
+            self._scan_cache = None
+            return None
+        if self._session_cache is not None:
+            self._session_cache[path] = content
+        return content
+
     def load_file(self, relative_path: str) -> str | None:
         path = self.memory_dir / relative_path
+        if self._session_cache is not None and path in self._session_cache:
+            return self._session_cache[path]
         if path.exists():
-            return path.read_text(encoding="utf-8")
+            return self._cached_read(path)
         return None
 
     def save_file(self, relative_path: str, content: str):
         path = self.memory_dir / relative_path
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content, encoding="utf-8")
+        self._cache[path] = (path.stat().st_mtime_ns, content)
+        if self._session_cache is not None:
+            self._session_cache[path] = content
+        self._scan_cache = None  # a new file may have appeared
         log.info("Updated memory file: %s", relative_path)
 
     def load_domain(self, domain: str) -> str:
@@ -36,19 +113,9 @@ class MemoryBank:
             if content:
                 parts.append(content)
 
-        # Load all people files
-        for path in sorted(self.memory_dir.glob("people/*.md")):
-            if path.name.startswith("_"):
-                continue
-            content = path.read_text(encoding="utf-8")
-            parts.append(content)
-
-        # Load all project files
-        for path in sorted(self.memory_dir.glob("projects/*.md")):
-            if path.name.startswith("_"):
-                continue
-            content = path.read_text(encoding="utf-8")
-            parts.append(content)
+        # Load all people and project files
+        paths = self._scan().get("people", []) + self._scan().get("projects", [])
+        parts.extend(filter(None, self._executor.map(self._cached_read, paths)))
 
         return "\n\n---\n\n".join(parts) if parts else ""
 
@@ -56,24 +123,19 @@ class MemoryBank:
         """Load all memory files as context for synthesis."""
         parts = []
         for category in ["organizations", "people", "projects"]:
-            category_dir = self.memory_dir / category
-            if not category_dir.exists():
-                continue
-            for path in sorted(category_dir.glob("*.md")):
-                if path.name.startswith("_"):
-                    continue
-                content = path.read_text(encoding="utf-8")
-                if content.strip():
+            paths = self._scan().get(category, [])
+            # executor.map preserves path order, so output stays deterministic
+            for path, content in zip(paths, self._executor.map(self._cached_read, paths)):
+                if content and content.strip():
                     parts.append(f"[{category}/{path.name}]\n{content}")
         return "\n\n---\n\n".join(parts) if parts else "(No memory files yet)"
 
     def list_files(self) -> list[str]:
-        files = []
-        for path in self.memory_dir.rglob("*.md"):
-            if path.name.startswith("_"):
-                continue
-            files.append(str(path.relative_to(self.memory_dir)))
-        return sorted(files)
+        return sorted(
+            str(path.relative_to(self.memory_dir))
+            for paths in self._scan().values()
+            for path in paths
+        )
 
     def _domain_to_org(self, domain: str) -> str | None:
         mapping = {
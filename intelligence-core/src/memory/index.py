@@ -1,8 +1,15 @@
 import logging
 import sqlite3
+from datetime import datetime, timezone
+
+import orjson
 
 log = logging.getLogger("intelligence-core.memory.index")
 
+_UPSERT_SQL = """INSERT OR REPLACE INTO memory_index
+(entity_type, entity_name, file_path, aliases, last_updated)
+VALUES (?, ?, ?, ?, ?)"""
+
 
 class MemoryIndex:
     def __init__(self, db_path: str):
@@ -32,20 +39,20 @@ class MemoryIndex:
 
     def upsert(self, entity_type: str, entity_name: str, file_path: str,
                aliases: list[str] | None = None):
-        import json
-        from datetime import datetime, timezone
+        self.upsert_many([(entity_type, entity_name, file_path, aliases)])
+
+    def upsert_many(self, entries: list[tuple]):
+        """Upsert a batch of (entity_type, entity_name, file_path, aliases)
+        entries in one transaction, so index rebuilds pay one commit."""
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (entity_type, entity_name, file_path, orjson.dumps(aliases or []), now)
+            for entity_type, entity_name, file_path, aliases in entries
+        ]
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO memory_index
-                (entity_type, entity_name, file_path, aliases, last_updated)
-                VALUES (?, ?, ?, ?, ?)""",
-                (entity_type, entity_name, file_path,
-                 json.dumps(aliases or []),
-                 datetime.now(timezone.utc).isoformat()),
-            )
+            conn.executemany(_UPSERT_SQL, rows)
 
     def find_file(self, name: str) -> str | None:
-        import json
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             row = conn.execute(
@@ -57,7 +64,7 @@ class MemoryIndex:
 
             rows = conn.execute("SELECT entity_name, file_path, aliases FROM memory_index").fetchall()
             for r in rows:
-                aliases = json.loads(r["aliases"]) if r["aliases"] else []
+                aliases = orjson.loads(r["aliases"]) if r["aliases"] else []
                 if name.lower() in [a.lower() for a in aliases]:
                     return r["file_path"]
         return None
@@ -4,104 +4,102 @@ from .bank import MemoryBank
 
 log = logging.getLogger("intelligence-core.memory.updater")
 
+_MEMORY_UPDATE_RE = re.compile(
+    r"MEMORY_UPDATE_START\s*\n"
+    r"FILE:\s*([^\n]+)\n"
+    r"SECTION:\s*([^\n]+)\n"
+    r"ACTION:\s*(replace|append)\s*\n"
+    r"CONTENT:\s*\n(.*?)\n?"
+    r"MEMORY_UPDATE_END",
+    re.DOTALL,
+)
+
 
 def apply_memory_updates(bank: MemoryBank, claude_response: str) -> int:
     """Parse MEMORY_UPDATE blocks from Claude's response and apply them."""
-    pattern = re.compile(
-        r"MEMORY_UPDATE_START\s*\n"
-        r"FILE:\s*([^\n]+)\n"
-        r"SECTION:\s*([^\n]+)\n"
-        r"ACTION:\s*(replace|append)\s*\n"
-        r"CONTENT:\s*\n(.*?)\n?"
-        r"MEMORY_UPDATE_END",
-        re.DOTALL,
-    )
-
-    updates = pattern.findall(claude_response)
-    applied = 0
-
+    updates = [
+        (f.strip(), s.strip(), a.strip().lower(), c.strip())
+        for f, s, a, c in _MEMORY_UPDATE_RE.findall(claude_response)
+    ]
+    return apply_updates(bank, updates)
+
+
+def apply_updates(bank: MemoryBank, updates: list[tuple[str, str, str, str]]) -> int:
+    """Apply already-parsed (file, section, action, content) updates."""
+    # Group updates per file so each file is read and written once, however
+    # many of its sections the response touches.
+    by_file: dict[str, list[tuple[str, str, str]]] = {}
     for file_path, section, action, content in updates:
-        file_path = file_path.strip()
-        section = section.strip()
-        action = action.strip().lower()
-        content = content.strip()
+        by_file.setdefault(file_path, []).append((section, action, content))
 
+    applied = 0
+    for file_path, updates in by_file.items():
         existing = bank.load_file(file_path)
 
-        if existing is None:
-            # Create new file with this section
-            new_content = f"# {file_path.split('/')[-1].replace('.md', '').title()}\n\n## {section}\n{content}\n"
-            bank.save_file(file_path, new_content)
+        for section, action, content in updates:
+            if existing is None:
+                # Create new file with this section
+                existing = f"# {file_path.split('/')[-1].replace('.md', '').title()}\n\n## {section}\n{content}\n"
+            elif f"## {section}" in existing:
+                if action == "replace":
+                    existing = _replace_section(existing, section, content)
+                elif action == "append":
+                    existing = _append_to_section(existing, section, content)
+            else:
+                existing = existing.rstrip() + f"\n\n## {section}\n{content}\n"
             applied += 1
-            continue
-
-        section_header = f"## {section}"
-        if section_header in existing:
-            if action == "replace":
-                existing = _replace_section(existing, section, content)
-            elif action == "append":
-                existing = _append_to_section(existing, section, content)
-        else:
-            existing = existing.rstrip() + f"\n\n## {section}\n{content}\n"
 
         bank.save_file(file_path, existing)
-        applied += 1
 
     if applied:
         log.info("Applied %d memory updates", applied)
     return applied
 
 
-def _replace_section(text: str, section: str, new_content: str) -> str:
-    """Replace the content of a section, keeping the header."""
-    lines = text.split("\n")
-    result = []
-    in_target = False
-    replaced = False
-
-    for line in lines:
-        if line.strip() == f"## {section}":
-            result.append(line)
-            result.append(new_content)
-            in_target = True
-            replaced = True
-            continue
-
-        if in_target and line.startswith("## "):
-            in_target = False
+def _find_section(text: str, section: str) -> tuple[int, int]:
+    """Locate a section by header, without walking the file line by line.
+
+    Returns (body_start, next_header_start), where body_start is the offset
+    just past the header line and next_header_start is the offset of the
+    next "## " line (or len(text)). Returns (-1, -1) if the header is absent.
+    """
+    header = f"## {section}"
+    pos = 0
+    while True:
+        i = text.find(header, pos)
+        if i == -1:
+            return (-1, -1)
+        line_end = text.find("\n", i)
+        if line_end == -1:
+            line_end = len(text)
+        # Must be a whole header line, not a substring match mid-line
+        if (i == 0 or text[i - 1] == "\n") and not text[i + len(header):line_end].strip():
+            body_start = min(line_end + 1, len(text))
+            j = text.find("\n## ", line_end)
+            return (body_start, len(text) if j == -1 else j + 1)
+        pos = line_end
 
-        if not in_target:
-            result.append(line)
 
-    return "\n".join(result)
+def _replace_section(text: str, section: str, new_content: str) -> str:
+    """Replace the content of a section, keeping the header."""
+    body_start, next_header = _find_section(text, section)
+    if body_start == -1:
+        return text
+    head = text[:body_start]
+    # Header at end of file with no trailing newline: terminate it so the
+    # new body doesn't get glued onto the header line
+    if head and not head.endswith("\n"):
+        head += "\n"
+    return head + new_content + "\n" + text[next_header:]
 
 
 def _append_to_section(text: str, section: str, new_content: str) -> str:
     """Append content to the end of a section."""
-    lines = text.split("\n")
-    result = []
-    in_target = False
-    appended = False
-
-    for i, line in enumerate(lines):
-        if line.strip() == f"## {section}":
-            in_target = True
-
-        if in_target and not appended:
-            next_is_new_section = (
-                i + 1 < len(lines) and lines[i + 1].startswith("## ")
-            ) or i == len(lines) - 1
-
-            if next_is_new_section:
-                result.append(line)
-                result.append(new_content)
-                in_target = False
-                appended = True
-                continue
-
-        result.append(line)
-
-    if in_target and not appended:
-        result.append(new_content)
-
-    return "\n".join(result)
+    body_start, next_header = _find_section(text, section)
+    if body_start == -1:
+        return text
+    if next_header >= len(text):
+        # Section runs to end of file: append on a new line, keeping any
+        # blank line the file already ends with
+        return text + "\n" + new_content
+    return text[:next_header] + new_content + "\n" + text[next_header:]
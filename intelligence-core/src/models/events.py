@@ -1,15 +1,40 @@
 import json
 import logging
 import sqlite3
+import threading
 import uuid
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 log = logging.getLogger("intelligence-core.events")
 
 
-@dataclass
+def _to_us(dt: datetime) -> int:
+    """Datetime -> integer Unix microseconds (the events.timestamp encoding)."""
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_us(us: int) -> datetime:
+    return datetime.fromtimestamp(us / 1_000_000, tz=timezone.utc)
+
+_INSERT_EVENT_SQL = """INSERT OR IGNORE INTO events
+(id, source, source_id, event_type, timestamp,
+ sender_name, sender_id, recipient_name,
+ channel_name, channel_id, title, content,
+ domain, importance, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# executemany sweet spot: big enough to amortize statement overhead, small
+# enough to keep the parameter list out of trouble on huge backfills.
+_INSERT_CHUNK = 10_000
+
+_INSERT_LOG_SQL = """INSERT INTO collection_log
+(source, events_collected, status, error_message, duration_seconds)
+VALUES (?, ?, ?, ?, ?)"""
+
+
+@dataclass(slots=True)
 class Event:
     source: str
     source_id: str
@@ -31,17 +56,36 @@ class Event:
 class EventStore:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # Single long-lived connection instead of a connect per call.
+        # Collection runs on the asyncio loop thread while synthesis runs in
+        # the scheduler's executor (check_same_thread=False), and sqlite3
+        # only serializes individual statements, not transactions — so every
+        # `with self._conn` below is guarded by _lock to keep one thread's
+        # commit/rollback from landing mid-way through the other's batch.
+        # detect_types=0 (explicit): no PARSE_DECLTYPES converters ever run
+        # on SELECT rows — timestamps are plain integers decoded in
+        # _row_to_event, everything else is raw TEXT.
+        self._conn = sqlite3.connect(db_path, detect_types=0, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        # WAL sticks to the database file; writers no longer block readers
+        # and NORMAL sync skips the per-commit fsync WAL makes safe.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA busy_timeout=5000")
         self._init_db()
 
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS events (
                     id TEXT PRIMARY KEY,
                     source TEXT NOT NULL,
                     source_id TEXT,
                     event_type TEXT NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     sender_name TEXT,
                     sender_id TEXT,
                     recipient_name TEXT,
@@ -56,9 +100,31 @@ class EventStore:
                     UNIQUE(source, source_id)
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_source ON events(source)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_domain ON events(domain)")
+            # Composite indexes: (timestamp, source) serves both shapes of
+            # get_events_since with one range scan, (domain, timestamp) the
+            # per-domain queries. Their prefixes supersede the old
+            # single-column indexes, which are dropped on existing databases.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_ts_source ON events(timestamp, source)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_domain_ts ON events(domain, timestamp)"
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_events_timestamp")
+            conn.execute("DROP INDEX IF EXISTS idx_events_source")
+            conn.execute("DROP INDEX IF EXISTS idx_events_domain")
+
+            # Schema v1: timestamps moved from ISO text to integer Unix
+            # microseconds. Backfill any text rows from older databases once
+            # (julianday keeps sub-second precision to within ~50us, well
+            # inside what message ordering needs).
+            if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                conn.execute(
+                    "UPDATE events SET timestamp = "
+                    "CAST((julianday(timestamp) - 2440587.5) * 86400000000 AS INTEGER) "
+                    "WHERE typeof(timestamp) = 'text'"
+                )
+                conn.execute("PRAGMA user_version = 1")
 
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS collection_log (
@@ -72,58 +138,82 @@ class EventStore:
                 )
             """)
 
+    @staticmethod
+    def _event_rows(events: list[Event]) -> list[tuple]:
+        return [
+            (
+                event.id, event.source, event.source_id,
+                event.event_type, _to_us(event.timestamp),
+                event.sender_name, event.sender_id,
+                event.recipient_name, event.channel_name,
+                event.channel_id, event.title, event.content,
+                event.domain, event.importance,
+                json.dumps(event.metadata) if event.metadata else None,
+            )
+            for event in events
+        ]
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, rows: list[tuple]) -> int:
+        # Chunked executemany inside one transaction: a single fsync per
+        # batch instead of one per event. INSERT OR IGNORE swallows
+        # duplicates and rowcount reports only the rows actually inserted.
+        stored = 0
+        for i in range(0, len(rows), _INSERT_CHUNK):
+            cur = conn.executemany(_INSERT_EVENT_SQL, rows[i:i + _INSERT_CHUNK])
+            stored += cur.rowcount
+        return stored
+
     def store_events(self, events: list[Event]) -> int:
+        if not events:
+            return 0
+        with self._lock, self._conn as conn:
+            return self._insert_rows(conn, self._event_rows(events))
+
+    def store_and_log(self, events: list[Event], source: str, status: str,
+                      error: Optional[str] = None, duration: float = 0.0,
+                      prior: int = 0) -> int:
+        """Store a batch and its collection_log row in one transaction.
+
+        One commit for the logical "ingest sweep" instead of separate
+        store/log commits. `prior` is added to the logged count for sweeps
+        that already stored earlier batches. Returns rows inserted here.
+        """
         stored = 0
-        with sqlite3.connect(self.db_path) as conn:
-            for event in events:
-                try:
-                    conn.execute(
-                        """INSERT OR IGNORE INTO events
-                        (id, source, source_id, event_type, timestamp,
-                         sender_name, sender_id, recipient_name,
-                         channel_name, channel_id, title, content,
-                         domain, importance, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            event.id, event.source, event.source_id,
-                            event.event_type, event.timestamp.isoformat(),
-                            event.sender_name, event.sender_id,
-                            event.recipient_name, event.channel_name,
-                            event.channel_id, event.title, event.content,
-                            event.domain, event.importance,
-                            json.dumps(event.metadata) if event.metadata else None,
-                        ),
-                    )
-                    if conn.total_changes:
-                        stored += 1
-                except sqlite3.IntegrityError:
-                    pass
+        with self._lock, self._conn as conn:
+            if events:
+                stored = self._insert_rows(conn, self._event_rows(events))
+            conn.execute(_INSERT_LOG_SQL, (source, prior + stored, status, error, duration))
         return stored
 
+    def classify_events_since(self, since: datetime, case_sql: str,
+                              case_params: list[str]) -> int:
+        """Label unclassified events via a CASE expression in one SQL pass."""
+        with self._lock, self._conn as conn:
+            cur = conn.execute(
+                f"UPDATE events SET domain = {case_sql} "
+                "WHERE domain IS NULL AND timestamp > ?",
+                (*case_params, _to_us(since)),
+            )
+            return cur.rowcount
+
     def get_events_since(self, since: datetime, source: Optional[str] = None) -> list[Event]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            if source:
-                rows = conn.execute(
-                    "SELECT * FROM events WHERE timestamp > ? AND source = ? ORDER BY timestamp",
-                    (since.isoformat(), source),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM events WHERE timestamp > ? ORDER BY timestamp",
-                    (since.isoformat(),),
-                ).fetchall()
+        if source:
+            rows = self._conn.execute(
+                "SELECT * FROM events WHERE timestamp > ? AND source = ? ORDER BY timestamp",
+                (_to_us(since), source),
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT * FROM events WHERE timestamp > ? ORDER BY timestamp",
+                (_to_us(since),),
+            ).fetchall()
         return [self._row_to_event(r) for r in rows]
 
     def log_collection(self, source: str, count: int, status: str,
                        error: Optional[str] = None, duration: float = 0.0):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """INSERT INTO collection_log
-                (source, events_collected, status, error_message, duration_seconds)
-                VALUES (?, ?, ?, ?, ?)""",
-                (source, count, status, error, duration),
-            )
+        with self._lock, self._conn as conn:
+            conn.execute(_INSERT_LOG_SQL, (source, count, status, error, duration))
 
     def _row_to_event(self, row: sqlite3.Row) -> Event:
         meta = {}
@@ -137,7 +227,7 @@ class EventStore:
             source=row["source"],
             source_id=row["source_id"],
             event_type=row["event_type"],
-            timestamp=datetime.fromisoformat(row["timestamp"]),
+            timestamp=_from_us(row["timestamp"]),
             sender_name=row["sender_name"],
             sender_id=row["sender_id"],
             recipient_name=row["recipient_name"],
@@ -6,10 +6,10 @@ import anthropic
 from .. import config
 from ..models.events import Event, EventStore
 from ..memory.bank import MemoryBank
-from ..memory.updater import apply_memory_updates
-from ..synthesis.classifier import classify_event
-from ..synthesis.prompts import SYSTEM_PROMPT, build_user_prompt
-from ..synthesis.formatter import format_events_digest, extract_briefing
+from ..memory.updater import apply_updates
+from ..synthesis.classifier import classify_event, domain_case_sql
+from ..synthesis.prompts import SYSTEM_PROMPT, build_memory_context, build_user_prompt
+from ..synthesis.formatter import format_events_digest, parse_claude_response
 
 log = logging.getLogger("intelligence-core.synthesis")
 
@@ -24,33 +24,38 @@ class SynthesisEngine:
         """Run the full synthesis pipeline. Returns the briefing text or None."""
         since = datetime.now(timezone.utc) - timedelta(hours=config.MESSAGE_HOURS)
 
-        # Step 1: Get all events
+        # Memory files read for context don't need re-reading when the
+        # update step touches them moments later.
+        with self.memory_bank.session():
+            return self._synthesize(since)
+
+    def _synthesize(self, since: datetime) -> str | None:
+        # Step 1: Classify any unclassified events in one SQL pass, then load
+        case_sql, case_params = domain_case_sql()
+        self.event_store.classify_events_since(since, case_sql, case_params)
         events = self.event_store.get_events_since(since)
         if not events:
             log.info("No events in the last %d hours. Skipping synthesis.", config.MESSAGE_HOURS)
             return None
 
-        # Step 2: Classify events by domain
-        for event in events:
-            if not event.domain:
-                event.domain = classify_event(event)
-
+        # Step 2: Format events digest — the same pass labels any event the
+        # SQL update missed and tallies the per-domain counts
+        digest, counts = format_events_digest(events, classify_event)
         log.info(
             "Synthesizing %d events: %d BI Branch, %d P45, %d Personal",
             len(events),
-            sum(1 for e in events if e.domain == "bi_branch"),
-            sum(1 for e in events if e.domain == "platform45"),
-            sum(1 for e in events if e.domain == "personal"),
+            counts["bi_branch"],
+            counts["platform45"],
+            counts["personal"],
         )
 
-        # Step 3: Format events digest
-        digest = format_events_digest(events)
-
-        # Step 4: Load memory context
+        # Step 3: Load memory context
         memory_context = self.memory_bank.load_all_memory()
 
-        # Step 5: Build prompt and call Claude
-        user_prompt = build_user_prompt(digest, memory_context, config.MESSAGE_HOURS)
+        # Step 4: Build prompt and call Claude. The system prompt and memory
+        # bank are stable between calls, so mark both cacheable and keep only
+        # the per-day digest in the (uncached) user message.
+        user_prompt = build_user_prompt(digest, config.MESSAGE_HOURS)
 
         log.info(
             "Calling Claude: %d chars digest, %d chars memory",
@@ -60,19 +65,30 @@ class SynthesisEngine:
         message = self.client.messages.create(
             model="claude-sonnet-4-5-20250929",
             max_tokens=4096,
-            system=SYSTEM_PROMPT,
+            system=[
+                {
+                    "type": "text",
+                    "text": SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {
+                    "type": "text",
+                    "text": build_memory_context(memory_context),
+                    "cache_control": {"type": "ephemeral"},
+                },
+            ],
             messages=[{"role": "user", "content": user_prompt}],
         )
 
         response_text = message.content[0].text
         log.info("Claude response: %d chars", len(response_text))
 
-        # Step 6: Extract briefing
-        briefing = extract_briefing(response_text)
+        # Step 5: Parse the response once — briefing and memory updates
+        briefing, memory_updates = parse_claude_response(response_text)
         log.info("Briefing extracted: %d chars", len(briefing))
 
-        # Step 7: Apply memory updates
-        updates = apply_memory_updates(self.memory_bank, response_text)
+        # Step 6: Apply memory updates
+        updates = apply_updates(self.memory_bank, memory_updates)
         if updates:
             log.info("Applied %d memory updates", updates)
 
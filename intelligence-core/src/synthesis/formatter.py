@@ -1,73 +1,147 @@
-import re
+from collections import Counter
+from itertools import groupby
+from typing import Callable, Optional
+
 from ..models.events import Event
 
+_SOURCE_LABELS = {
+    "whatsapp": "WHATSAPP",
+    "gmail": "EMAIL",
+    "slack": "SLACK",
+    "github": "GITHUB",
+    "granola": "MEETING NOTES",
+    "notion": "NOTION",
+}
+
+_HEADER_EQ = "=" * 40
+
+
+def _group_key(event: Event) -> tuple[str, str]:
+    return (event.source, event.channel_name or "Direct")
 
-def format_events_digest(events: list[Event]) -> str:
-    """Group events by source and channel, format as readable digest."""
-    by_source: dict[str, dict[str, list[Event]]] = {}
 
-    for event in events:
-        source = event.source
-        channel = event.channel_name or "Direct"
-        if source not in by_source:
-            by_source[source] = {}
-        if channel not in by_source[source]:
-            by_source[source][channel] = []
-        by_source[source][channel].append(event)
+def format_events_digest(
+    events: list[Event],
+    classify_fn: Optional[Callable[[Event], str]] = None,
+) -> tuple[str, Counter]:
+    """Group events by source and channel, format as readable digest.
 
+    The formatting loop doubles as the domain pass: any event still
+    missing a domain is labelled via classify_fn, and per-domain counts
+    are tallied while lines are emitted, so callers get the digest and
+    the counts from one traversal. Returns (digest, domain_counts).
+    """
+    # One stable sort + groupby instead of nested dict-of-list bucketing.
+    # Channel counts are precomputed so busiest channels sort first without
+    # a len() per comparison; stability keeps input order within a channel.
+    counts = Counter(map(_group_key, events))
+    ordered = sorted(
+        events, key=lambda e: (e.source, -counts[_group_key(e)], e.channel_name or "Direct")
+    )
+
+    domain_counts: Counter = Counter()
     lines = []
 
-    source_labels = {
-        "whatsapp": "WHATSAPP",
-        "gmail": "EMAIL",
-        "slack": "SLACK",
-        "github": "GITHUB",
-        "granola": "MEETING NOTES",
-        "notion": "NOTION",
-    }
-
-    for source, channels in sorted(by_source.items()):
-        label = source_labels.get(source, source.upper())
-        lines.append(f"\n{'=' * 40}")
-        lines.append(f"{label}")
-        lines.append(f"{'=' * 40}")
-
-        for channel, channel_events in sorted(
-            channels.items(), key=lambda x: len(x[1]), reverse=True
+    for source, source_events in groupby(ordered, key=lambda e: e.source):
+        label = _SOURCE_LABELS.get(source, source.upper())
+        lines.extend((f"\n{_HEADER_EQ}", label, _HEADER_EQ))
+
+        for channel, channel_events in groupby(
+            source_events, key=lambda e: e.channel_name or "Direct"
         ):
-            lines.append(f"\n--- {channel} ({len(channel_events)} items) ---")
+            lines.append(f"\n--- {channel} ({counts[(source, channel)]} items) ---")
             for evt in channel_events:
+                if evt.domain is None and classify_fn is not None:
+                    evt.domain = classify_fn(evt)
+                domain_counts[evt.domain] += 1
                 ts = evt.timestamp.strftime("%m-%d %H:%M") if evt.timestamp else ""
                 sender = evt.sender_name or "Unknown"
                 if evt.title:
-                    lines.append(f"[{ts}] {sender}: {evt.title}")
                     if evt.content:
-                        # Truncate long content
+                        # Truncate long content; one extend per event keeps
+                        # list growth to a single call
                         content = evt.content[:500]
                         if len(evt.content) > 500:
                             content += "..."
-                        lines.append(f"  {content}")
+                        lines.extend((f"[{ts}] {sender}: {evt.title}", f"  {content}"))
+                    else:
+                        lines.append(f"[{ts}] {sender}: {evt.title}")
                 else:
                     content = evt.content or ""
                     if len(content) > 500:
                         content = content[:500] + "..."
                     lines.append(f"[{ts}] {sender}: {content}")
 
-    return "\n".join(lines)
+    return "\n".join(lines), domain_counts
 
 
-def extract_briefing(claude_response: str) -> str:
-    """Extract the briefing text from Claude's response."""
-    match = re.search(
-        r"BRIEFING_START\n(.*?)\nBRIEFING_END",
-        claude_response,
-        re.DOTALL,
-    )
-    if match:
-        return match.group(1).strip()
+def _parse_update_block(block: str) -> tuple[str, str, str, str] | None:
+    """Parse one MEMORY_UPDATE block body into (file, section, action, content)."""
+    fields = []
+    pos = 0
+    for key in ("FILE:", "SECTION:", "ACTION:"):
+        i = block.find(key, pos)
+        if i == -1:
+            return None
+        eol = block.find("\n", i)
+        if eol == -1:
+            return None
+        fields.append(block[i + len(key):eol].strip())
+        pos = eol + 1
+    i = block.find("CONTENT:", pos)
+    if i == -1:
+        return None
+    eol = block.find("\n", i)
+    content = block[eol + 1:] if eol != -1 else ""
+    file_path, section, action = fields
+    action = action.lower()
+    if action not in ("replace", "append"):
+        return None
+    return (file_path, section, action, content.strip())
+
+
+def parse_claude_response(claude_response: str) -> tuple[str, list[tuple[str, str, str, str]]]:
+    """Single left-to-right pass over Claude's response.
 
-    # Fallback: if no markers, take everything before MEMORY_UPDATE_START
-    if "MEMORY_UPDATE_START" in claude_response:
-        return claude_response[:claude_response.index("MEMORY_UPDATE_START")].strip()
+    Returns (briefing, updates) where updates are
+    (file, section, action, content) tuples, so the engine parses the
+    response once instead of the briefing and memory consumers each
+    re-scanning it.
+    """
+    text = claude_response
+    briefing = None
+    updates: list[tuple[str, str, str, str]] = []
+    first_update = len(text)
+    pos = 0
+    while True:
+        b = text.find("BRIEFING_START", pos)
+        u = text.find("MEMORY_UPDATE_START", pos)
+        if b == -1 and u == -1:
+            break
+        if u == -1 or (b != -1 and b < u):
+            end = text.find("BRIEFING_END", b)
+            if end == -1:
+                pos = b + len("BRIEFING_START")
+                continue
+            if briefing is None:
+                briefing = text[b + len("BRIEFING_START"):end].strip()
+            pos = end + len("BRIEFING_END")
+        else:
+            first_update = min(first_update, u)
+            end = text.find("MEMORY_UPDATE_END", u)
+            if end == -1:
+                break
+            parsed = _parse_update_block(text[u + len("MEMORY_UPDATE_START"):end])
+            if parsed is not None:
+                updates.append(parsed)
+            pos = end + len("MEMORY_UPDATE_END")
 
-    return claude_response.strip()
+    if briefing is None:
+        # No briefing markers: take everything before the first memory update
+        briefing = text[:first_update].strip()
+    return briefing, updates
+
+
+def extract_briefing(claude_response: str) -> str:
+    """Extract the briefing text from Claude's response."""
+    return parse_claude_response(claude_response)[0]
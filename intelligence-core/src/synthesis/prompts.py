@@ -85,14 +85,15 @@ BRIEFING_END
 [Memory updates follow here if any]"""
 
 
-def build_user_prompt(events_digest: str, memory_context: str, hours: int) -> str:
+def build_memory_context(memory_context: str) -> str:
+    """Frame the memory bank as a system block (kept stable for caching)."""
     return f"""Here is Jarred's accumulated knowledge about his contacts and projects:
 
-{memory_context}
+{memory_context}"""
 
----
 
-Here are Jarred's communications from the last {hours} hours across all platforms:
+def build_user_prompt(events_digest: str, hours: int) -> str:
+    return f"""Here are Jarred's communications from the last {hours} hours across all platforms:
 
 {events_digest}
 